@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry # type: ignore
 from homeassistant.core import HomeAssistant # type: ignore
+from homeassistant.helpers.debounce import Debouncer # type: ignore
 
 from .const import DOMAIN
 from .coordinator import LoadBalancerCoordinator
@@ -13,13 +15,36 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor", "switch"]
 
+# Coalesce rapid options saves into one reload: the first runs immediately,
+# further saves within the cooldown collapse into a single trailing reload.
+RELOAD_COOLDOWN_SECS = 30
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Dynamic Load Balancer from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
+    # Idempotent re-entry guard: a double invocation (e.g. a racing reload)
+    # must not overwrite the stored coordinator and leak the old one's
+    # background tasks.
+    if entry.entry_id in hass.data[DOMAIN]:
+        _LOGGER.debug("Entry %s already set up, skipping", entry.entry_id)
+        return True
+
     coordinator = LoadBalancerCoordinator(hass, entry)
     await coordinator.async_config_entry_first_refresh()
+    coordinator.async_register_listeners()
+
+    coordinator.reload_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=RELOAD_COOLDOWN_SECS,
+        immediate=True,
+        # async_schedule_reload cancels any pending setup-retry timer first,
+        # avoiding the OperationNotAllowed race a raw async_reload can hit.
+        function=partial(hass.config_entries.async_schedule_reload, entry.entry_id),
+    )
+    entry.async_on_unload(coordinator.reload_debouncer.async_shutdown)
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -32,8 +57,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update by reloading the entry."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle options update by reloading the entry (debounced)."""
+    coordinator: LoadBalancerCoordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.reload_debouncer.async_call()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -41,6 +67,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Tolerate a missing key — a failed partial setup may never have
+        # stored the coordinator, and a KeyError here would leave the entry
+        # half-unloaded and force a retry cycle.
+        hass.data[DOMAIN].pop(entry.entry_id, None)
     
     return unload_ok
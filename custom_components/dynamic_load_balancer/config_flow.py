@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import logging
+import weakref
+from collections import ChainMap
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -35,199 +38,240 @@ from .const import (
     CONF_PHASE_3_SENSOR,
     CONF_RESTORE_HEADROOM,
     CONF_SPIKE_FILTER_TIME,
+    CONF_UPDATE_INTERVAL,
     DEFAULT_AGGRESSIVENESS,
     DEFAULT_ENABLED_PHASES,
     DEFAULT_FUSE_SIZE,
     DEFAULT_NOTIFY_ENABLED,
     DEFAULT_RESTORE_HEADROOM,
     DEFAULT_SPIKE_FILTER_TIME,
+    DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    trigger_current,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _trigger_placeholders(fuse: float) -> dict[str, str]:
+    """Build the behavior step's description placeholders for a fuse size.
+
+    Cached per fuse size — the form is typically re-rendered several times
+    with the same value, and the result is consumed read-only by the frontend.
+    """
+    return {
+        "fuse_size": str(fuse),
+        "very_low_trigger": str(round(trigger_current(fuse, "very_low"), 1)),
+        "low_trigger": str(round(trigger_current(fuse, "low"), 1)),
+        "medium_trigger": str(round(trigger_current(fuse, "medium"), 1)),
+        "high_trigger": str(round(trigger_current(fuse, "high"), 1)),
+        "very_high_trigger": str(round(trigger_current(fuse, "very_high"), 1)),
+    }
+
+
+# Shared between the behavior step and the options flow — built once so each
+# form render doesn't reallocate the five option dicts.
+_AGGRESSIVENESS_OPTIONS = [
+    {"value": "very_low", "label": "Very Low (100% capacity)"},
+    {"value": "low", "label": "Low (95% capacity)"},
+    {"value": "medium", "label": "Medium (90% capacity)"},
+    {"value": "high", "label": "High (85% capacity)"},
+    {"value": "very_high", "label": "Very High (80% capacity)"},
+]
+
+# Selectors are immutable value holders, safe to share between the config and
+# options flows — build each one once so no form render reallocates them.
+_FUSE_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=10,
+        max=125,
+        step=1,
+        unit_of_measurement="A",
+        mode=NumberSelectorMode.BOX,
+    )
+)
+_AGGRESSIVENESS_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=_AGGRESSIVENESS_OPTIONS,
+        mode=SelectSelectorMode.DROPDOWN,
+    )
+)
+_SPIKE_FILTER_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=5,
+        max=300,
+        step=5,
+        unit_of_measurement="seconds",
+        mode=NumberSelectorMode.BOX,
+    )
+)
+_RESTORE_HEADROOM_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=1.0,
+        max=15.0,
+        step=0.5,
+        unit_of_measurement="A",
+        mode=NumberSelectorMode.BOX,
+    )
+)
+_UPDATE_INTERVAL_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=1,
+        max=60,
+        step=1,
+        unit_of_measurement="seconds",
+        mode=NumberSelectorMode.BOX,
+    )
+)
+_NOTIFY_BOOLEAN_SELECTOR = BooleanSelector()
+_NOTIFY_DEVICE_SELECTOR = DeviceSelector(DeviceSelectorConfig(integration="mobile_app"))
+
+# Schemas are static (the defaults never depend on flow state), so build them —
+# and their selector instances — once at import time instead of on every form
+# render. voluptuous compiles each schema to a validator function internally;
+# reusing the compiled schema is much cheaper than rebuilding it per step.
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_FUSE_SIZE, default=DEFAULT_FUSE_SIZE): _FUSE_SELECTOR,
+    }
+)
+
+STEP_PHASES_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_PHASE_1_SENSOR): EntitySelector(
+            EntitySelectorConfig(domain="sensor")
+        ),
+        vol.Optional(CONF_PHASE_2_SENSOR): EntitySelector(
+            EntitySelectorConfig(domain="sensor")
+        ),
+        vol.Optional(CONF_PHASE_3_SENSOR): EntitySelector(
+            EntitySelectorConfig(domain="sensor")
+        ),
+        vol.Required(
+            CONF_ENABLED_PHASES, default=list(DEFAULT_ENABLED_PHASES)
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=["1", "2", "3"],
+                multiple=True,
+                mode=SelectSelectorMode.LIST,
+            )
+        ),
+    }
+)
+
+STEP_BEHAVIOR_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_AGGRESSIVENESS, default=DEFAULT_AGGRESSIVENESS
+        ): _AGGRESSIVENESS_SELECTOR,
+        vol.Required(
+            CONF_SPIKE_FILTER_TIME, default=DEFAULT_SPIKE_FILTER_TIME
+        ): _SPIKE_FILTER_SELECTOR,
+        vol.Required(
+            CONF_RESTORE_HEADROOM, default=DEFAULT_RESTORE_HEADROOM
+        ): _RESTORE_HEADROOM_SELECTOR,
+        vol.Required(
+            CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+        ): _UPDATE_INTERVAL_SELECTOR,
+    }
+)
+
+STEP_ACTIONS_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_CHARGING_ENTITY): EntitySelector(
+            EntitySelectorConfig(domain=["number"])
+        ),
+        vol.Optional(CONF_DEVICES_TO_TOGGLE): EntitySelector(
+            EntitySelectorConfig(
+                domain=["switch", "climate", "water_heater"],
+                multiple=True,
+            )
+        ),
+        vol.Required(
+            CONF_NOTIFY_ENABLED, default=DEFAULT_NOTIFY_ENABLED
+        ): _NOTIFY_BOOLEAN_SELECTOR,
+        vol.Optional(CONF_NOTIFY_TARGET): _NOTIFY_DEVICE_SELECTOR,
+    }
+)
+
+
+# Wizard step table: step_id → (schema, attribute the result is stored under,
+# optional value extractor applied to the submitted input, next step_id or
+# None to create the entry). The four steps share identical control flow, so
+# it lives once in _async_handle_step instead of being copied per step.
+_WIZARD_STEPS: dict[str, tuple[vol.Schema, str, Any, str | None]] = {
+    # NumberSelector returns a float even with step=1 — store fuse size as int
+    # so the entry title and downstream arithmetic don't carry a ".0".
+    "user": (
+        STEP_USER_DATA_SCHEMA,
+        "_fuse_size",
+        lambda user_input: int(user_input[CONF_FUSE_SIZE]),
+        "phases",
+    ),
+    "phases": (STEP_PHASES_DATA_SCHEMA, "_phase_config", None, "behavior"),
+    "behavior": (STEP_BEHAVIOR_DATA_SCHEMA, "_behavior_config", None, "actions"),
+    "actions": (STEP_ACTIONS_DATA_SCHEMA, "_actions_config", None, None),
+}
+
+
 class DynamicLoadBalancerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Dynamic Load Balancer."""
 
     VERSION = 1
 
-    async def async_step_user(
-        self, user_input: dict[str, Any] | None = None
+    async def _async_handle_step(
+        self, step_id: str, user_input: dict[str, Any] | None
     ) -> config_entries.FlowResult:
-        """Handle the initial step - fuse size configuration."""
-        errors = {}
+        """Generic wizard step driver consulting _WIZARD_STEPS."""
+        schema, attr, extract, next_step = _WIZARD_STEPS[step_id]
 
         if user_input is not None:
-            self._fuse_size = user_input[CONF_FUSE_SIZE]
-            return await self.async_step_phases()
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_FUSE_SIZE, default=DEFAULT_FUSE_SIZE): NumberSelector(
-                    NumberSelectorConfig(
-                        min=10,
-                        max=125,
-                        step=1,
-                        unit_of_measurement="A",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
-            }
+            setattr(self, attr, extract(user_input) if extract else user_input)
+            if next_step is None:
+                return self.async_create_entry(
+                    title=f"Load Balancer ({self._fuse_size}A)",
+                    data={
+                        CONF_FUSE_SIZE: self._fuse_size,
+                        **self._phase_config,
+                        **self._behavior_config,
+                        **self._actions_config,
+                    },
+                )
+            return await self._async_handle_step(next_step, None)
+
+        placeholders = (
+            _trigger_placeholders(self._fuse_size) if step_id == "behavior" else None
         )
-
         return self.async_show_form(
-            step_id="user",
-            data_schema=data_schema,
-            errors=errors,
+            step_id=step_id,
+            data_schema=schema,
+            description_placeholders=placeholders,
         )
 
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Handle the initial step - fuse size configuration."""
+        return await self._async_handle_step("user", user_input)
+
     async def async_step_phases(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.FlowResult:
         """Handle phase sensor configuration."""
-        errors = {}
-
-        if user_input is not None:
-            self._phase_config = user_input
-            return await self.async_step_behavior()
-
-        data_schema = vol.Schema(
-            {
-                vol.Optional(CONF_PHASE_1_SENSOR): EntitySelector(
-                    EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_PHASE_2_SENSOR): EntitySelector(
-                    EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_PHASE_3_SENSOR): EntitySelector(
-                    EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Required(
-                    CONF_ENABLED_PHASES, default=DEFAULT_ENABLED_PHASES
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=["1", "2", "3"],
-                        multiple=True,
-                        mode=SelectSelectorMode.LIST,
-                    )
-                ),
-            }
-        )
-
-        return self.async_show_form(
-            step_id="phases",
-            data_schema=data_schema,
-            errors=errors,
-        )
+        return await self._async_handle_step("phases", user_input)
 
     async def async_step_behavior(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.FlowResult:
         """Handle behavior configuration."""
-        errors = {}
-
-        if user_input is not None:
-            self._behavior_config = user_input
-            return await self.async_step_actions()
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_AGGRESSIVENESS, default=DEFAULT_AGGRESSIVENESS
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            {"value": "very_low", "label": "Very Low (100% capacity)"},
-                            {"value": "low", "label": "Low (95% capacity)"},
-                            {"value": "medium", "label": "Medium (90% capacity)"},
-                            {"value": "high", "label": "High (85% capacity)"},
-                            {"value": "very_high", "label": "Very High (80% capacity)"},
-                        ],
-                        mode=SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Required(
-                    CONF_SPIKE_FILTER_TIME, default=DEFAULT_SPIKE_FILTER_TIME
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=5,
-                        max=300,
-                        step=5,
-                        unit_of_measurement="seconds",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Required(
-                    CONF_RESTORE_HEADROOM, default=DEFAULT_RESTORE_HEADROOM
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=1.0,
-                        max=15.0,
-                        step=0.5,
-                        unit_of_measurement="A",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
-            }
-        )
-
-        fuse = self._fuse_size
-        return self.async_show_form(
-            step_id="behavior",
-            data_schema=data_schema,
-            errors=errors,
-            description_placeholders={
-                "fuse_size": str(fuse),
-                "very_low_trigger": str(round(fuse * 1.00, 1)),
-                "low_trigger": str(round(fuse * 0.95, 1)),
-                "medium_trigger": str(round(fuse * 0.90, 1)),
-                "high_trigger": str(round(fuse * 0.85, 1)),
-                "very_high_trigger": str(round(fuse * 0.80, 1)),
-            },
-        )
+        return await self._async_handle_step("behavior", user_input)
 
     async def async_step_actions(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.FlowResult:
         """Handle actions and notifications configuration."""
-        errors = {}
-
-        if user_input is not None:
-            config_data = {
-                CONF_FUSE_SIZE: self._fuse_size,
-                **self._phase_config,
-                **self._behavior_config,
-                **user_input,
-            }
-            return self.async_create_entry(
-                title=f"Load Balancer ({self._fuse_size}A)",
-                data=config_data,
-            )
-
-        data_schema = vol.Schema(
-            {
-                vol.Optional(CONF_CHARGING_ENTITY): EntitySelector(
-                    EntitySelectorConfig(domain=["number"])
-                ),
-                vol.Optional(CONF_DEVICES_TO_TOGGLE): EntitySelector(
-                    EntitySelectorConfig(
-                        domain=["switch", "climate", "water_heater"],
-                        multiple=True,
-                    )
-                ),
-                vol.Required(
-                    CONF_NOTIFY_ENABLED, default=DEFAULT_NOTIFY_ENABLED
-                ): BooleanSelector(),
-                vol.Optional(CONF_NOTIFY_TARGET): DeviceSelector(DeviceSelectorConfig(integration="mobile_app")),
-            }
-        )
-
-        return self.async_show_form(
-            step_id="actions",
-            data_schema=data_schema,
-            errors=errors,
-        )
+        return await self._async_handle_step("actions", user_input)
 
     @staticmethod
     @callback
@@ -242,79 +286,58 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for the integration."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
-        """Initialize options flow."""
-        self.config_entry = config_entry
+        """Initialize options flow.
+
+        The entry is held through a weakref proxy so an abandoned flow object
+        sitting in the flow manager can't keep a replaced ConfigEntry (and the
+        coordinator it owns) alive across an options-update reload.
+        """
+        self.config_entry = weakref.proxy(config_entry)
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.FlowResult:
         """Manage the options."""
         if user_input is not None:
+            user_input[CONF_FUSE_SIZE] = int(user_input[CONF_FUSE_SIZE])
             return self.async_create_entry(title="", data=user_input)
 
-        current = {**self.config_entry.data, **self.config_entry.options}
+        # Lazy merged view (options shadow data) — avoids copying every key
+        # into a fresh dict each time the form is opened.
+        current = ChainMap(self.config_entry.options, self.config_entry.data)
 
+        # Defaults depend on the current entry, so the schema itself must be
+        # rebuilt per render — but the selector instances are shared constants.
         data_schema = vol.Schema(
             {
                 vol.Required(
                     CONF_FUSE_SIZE,
                     default=current.get(CONF_FUSE_SIZE, DEFAULT_FUSE_SIZE),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=10,
-                        max=125,
-                        step=1,
-                        unit_of_measurement="A",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
+                ): _FUSE_SELECTOR,
                 vol.Required(
                     CONF_AGGRESSIVENESS,
                     default=current.get(CONF_AGGRESSIVENESS, DEFAULT_AGGRESSIVENESS),
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=[
-                            {"value": "very_low", "label": "Very Low (100% capacity)"},
-                            {"value": "low", "label": "Low (95% capacity)"},
-                            {"value": "medium", "label": "Medium (90% capacity)"},
-                            {"value": "high", "label": "High (85% capacity)"},
-                            {"value": "very_high", "label": "Very High (80% capacity)"},
-                        ],
-                        mode=SelectSelectorMode.DROPDOWN,
-                    )
-                ),
+                ): _AGGRESSIVENESS_SELECTOR,
                 vol.Required(
                     CONF_SPIKE_FILTER_TIME,
                     default=current.get(CONF_SPIKE_FILTER_TIME, DEFAULT_SPIKE_FILTER_TIME),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=5,
-                        max=300,
-                        step=5,
-                        unit_of_measurement="seconds",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
+                ): _SPIKE_FILTER_SELECTOR,
                 vol.Required(
                     CONF_RESTORE_HEADROOM,
                     default=current.get(CONF_RESTORE_HEADROOM, DEFAULT_RESTORE_HEADROOM),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=1.0,
-                        max=15.0,
-                        step=0.5,
-                        unit_of_measurement="A",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
+                ): _RESTORE_HEADROOM_SELECTOR,
+                vol.Required(
+                    CONF_UPDATE_INTERVAL,
+                    default=current.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                ): _UPDATE_INTERVAL_SELECTOR,
                 vol.Required(
                     CONF_NOTIFY_ENABLED,
                     default=current.get(CONF_NOTIFY_ENABLED, DEFAULT_NOTIFY_ENABLED),
-                ): BooleanSelector(),
+                ): _NOTIFY_BOOLEAN_SELECTOR,
                 vol.Optional(
                     CONF_NOTIFY_TARGET,
                     description={"suggested_value": current.get(CONF_NOTIFY_TARGET)},
-                ): DeviceSelector(DeviceSelectorConfig(integration="mobile_app")),
+                ): _NOTIFY_DEVICE_SELECTOR,
             }
         )
 
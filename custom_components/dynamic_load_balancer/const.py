@@ -1,4 +1,6 @@
 """Constants for the Dynamic Load Balancer integration."""
+from functools import lru_cache
+from types import MappingProxyType
 
 DOMAIN = "dynamic_load_balancer"
 
@@ -15,20 +17,36 @@ CONF_DEVICES_TO_TOGGLE = "devices_to_toggle"
 CONF_NOTIFY_ENABLED = "notify_enabled"
 CONF_NOTIFY_TARGET = "notify_target"
 CONF_RESTORE_HEADROOM = "restore_headroom"
+CONF_UPDATE_INTERVAL = "update_interval"
 
 # Default values
 DEFAULT_FUSE_SIZE = 25
 DEFAULT_AGGRESSIVENESS = "medium"
 DEFAULT_SPIKE_FILTER_TIME = 30  # seconds
-DEFAULT_ENABLED_PHASES = ["1", "2", "3"]
+DEFAULT_ENABLED_PHASES = ("1", "2", "3")
 DEFAULT_NOTIFY_ENABLED = True
 DEFAULT_RESTORE_HEADROOM = 3.0  # Amperes of free capacity required before restoration
+DEFAULT_UPDATE_INTERVAL = 5  # seconds between balancing cycles
+DEFAULT_DEVICE_DRAW = 5.0  # estimated Amperes removed by toggling one device off
 
-# Aggressiveness levels (percentage of fuse capacity to trigger at)
-AGGRESSIVENESS_LEVELS = {
+# Aggressiveness levels (percentage of fuse capacity to trigger at).
+# Read-only: downstream hot loops index into this every balancing tick,
+# and nothing should ever mutate or defensively copy it.
+AGGRESSIVENESS_LEVELS = MappingProxyType({
     "very_low": 1.00, # Trigger at 100% capacity (at the fuse limit itself)
     "low": 0.95,      # Trigger at 95% capacity
     "medium": 0.90,   # Trigger at 90% capacity
     "high": 0.85,     # Trigger at 85% capacity
     "very_high": 0.80 # Trigger at 80% capacity
-}
+})
+
+
+@lru_cache(maxsize=32)
+def trigger_current(fuse_size: float, level: str) -> float:
+    """Return the trigger threshold in Amperes for a fuse size and aggressiveness level.
+
+    Memoized: only a handful of (fuse_size, level) pairs ever occur per install,
+    so callers on the hot balancing path get a cache hit instead of redoing the
+    dict lookup and multiplication every tick.
+    """
+    return fuse_size * AGGRESSIVENESS_LEVELS[level]
@@ -1,14 +1,19 @@
 """Coordinator for Dynamic Load Balancer."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, State
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, slugify
 
 from .const import (
     AGGRESSIVENESS_LEVELS,
@@ -24,10 +29,16 @@ from .const import (
     CONF_PHASE_3_SENSOR,
     CONF_RESTORE_HEADROOM,
     CONF_SPIKE_FILTER_TIME,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_DEVICE_DRAW,
+    DEFAULT_ENABLED_PHASES,
     DEFAULT_FUSE_SIZE,
     DEFAULT_NOTIFY_ENABLED,
     DEFAULT_RESTORE_HEADROOM,
+    DEFAULT_SPIKE_FILTER_TIME,
+    DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    trigger_current,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,12 +51,34 @@ RESTORE_SETTLE_SECS = 60     # seconds
 # re-enable). Gives the system time to observe the effect of each step.
 RESTORE_STEP_SECS = 60       # seconds
 
-# Maps enabled-phase numbers to their sensor config keys
-_PHASE_SENSOR_KEY = {
-    1: CONF_PHASE_1_SENSOR,
-    2: CONF_PHASE_2_SENSOR,
-    3: CONF_PHASE_3_SENSOR,
-}
+# Sensor states that must not be parsed as a current reading. Built from HA's
+# interned constants so membership tests compare pointers, not characters.
+_BAD_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+
+
+def _parse_float(state: State | None) -> float | None:
+    """Parse a state's value as a float, or None if missing/unavailable/invalid."""
+    if state is None or state.state in _BAD_STATES:
+        return None
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
+
+
+# Identical overload notifications (same phases, same threshold) within this
+# window are coalesced into one alert.
+NOTIFY_MIN_INTERVAL_SECS = 300   # seconds
+
+# A phase above this fraction of the trigger threshold keeps the fast poll
+# cadence even when no overload timer is running — one more appliance could
+# tip it over, and a whole idle interval of detection latency would be rude.
+NEAR_TRIGGER_RATIO = 0.7
+
+# Safety-net poll cadence while nothing is being managed. The phase sensors
+# push state-change events anyway, so idle polling only advances timers; a
+# pre-allocated timedelta avoids a per-tick allocation when flipping cadence.
+IDLE_UPDATE_INTERVAL = timedelta(seconds=30)
 
 
 class LoadBalancerCoordinator(DataUpdateCoordinator):
@@ -53,179 +86,413 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
+        # Merge base data with any user-saved options (options take precedence)
+        config = {**entry.data, **entry.options}
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=5),
+            update_interval=timedelta(
+                seconds=config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+            ),
+            # Steady state (no overload, nothing to restore) produces an
+            # identical payload tick after tick — skip the listener fan-out and
+            # entity state writes for those. Requires the payload to be built
+            # from equality-stable values (see _get_phase_currents rounding and
+            # the tuple-valued disabled_devices below).
+            always_update=False,
         )
         self.entry = entry
-        # Merge base data with any user-saved options (options take precedence)
-        self.config = {**entry.data, **entry.options}
+        self.config = config
+
+        # Static per-entry mapping of phase number → sensor entity_id, built
+        # once so the per-tick read loop does no config lookups.
+        self._phase_sensor_map: tuple[tuple[int, str], ...] = tuple(
+            (phase, sensor_id)
+            for phase, conf_key in (
+                (1, CONF_PHASE_1_SENSOR),
+                (2, CONF_PHASE_2_SENSOR),
+                (3, CONF_PHASE_3_SENSOR),
+            )
+            if (sensor_id := config.get(conf_key))
+        )
+        self._configured_phases = frozenset(p for p, _ in self._phase_sensor_map)
+        self._recompute_params()
 
-        # Overload tracking per phase
-        self.overload_start: dict[int, Any] = {1: None, 2: None, 3: None}
+        # Overload tracking per phase: fixed 3-slot list indexed by phase-1.
+        # Three phases never grow or shrink, so array indexing beats dict
+        # hashing in the per-tick loop.
+        self._overload_start_ts: list[float | None] = [None, None, None]
 
         # Reduction rate limiting
-        self.last_action_time: Any = None
+        self.last_action_time: float | None = None
 
         # Restoration state
         self.charging_original_value: float | None = None
-        self.disabled_devices: set[str] = set()
-        self.restore_headroom_since: Any = None  # When sufficient headroom was first seen
-        self.last_restore_step_time: Any = None  # When the last restoration step was taken
+        # Bitmask over _device_draws indices — the configured device list is
+        # tiny and fixed, so bit ops beat set hashing for membership and the
+        # disabled_devices property materializes names only when asked
+        self._disabled_mask = 0
+        self.restore_headroom_since: float | None = None  # When sufficient headroom was first seen
+        self.last_restore_step_time: float | None = None  # When the last restoration step was taken
+        self._next_restore_wait: float | None = None  # Seconds until the next settle/step deadline
 
         # Last overload event — stored for the sensor and for deduplicating notifications
         self.last_triggered_time: Any = None
-        self.last_triggered_phases: list[int] = []
+        self.last_triggered_phases: tuple[int, ...] = ()
         self.last_triggered_peak: float | None = None
         self.last_triggered_threshold: float | None = None
+        self._last_notify_key: tuple | None = None
+        self._last_notify_time: float | None = None
+        # device_id → notify service name; stable for a HA session (changes
+        # only when the companion app is re-paired)
+        self._notify_service_cache: dict[str, str] = {}
+
+        # Charger (min, max, step) attributes — static per device, dropped
+        # when the charger entity reports a state change
+        self._charger_limits: tuple[float, float, float] | None = None
+
+        # sensor_id → (State object, parsed value): HA reuses the same State
+        # instance until the sensor actually changes, so an identity check
+        # skips the str→float parse on ticks where the reading is unchanged
+        self._parsed_cache: dict[str, tuple[object, float | None]] = {}
 
         # Overall state
         self.is_managing_load = False
         self.enabled = True  # Controlled by switch entity
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from sensors and manage load."""
-        phase_currents = await self._get_phase_currents()
+    def _recompute_params(self) -> None:
+        """Derive the per-tick balancing parameters from the merged config.
 
-        fuse_size = float(self.config.get(CONF_FUSE_SIZE, DEFAULT_FUSE_SIZE))
-        aggressiveness = self.config.get(CONF_AGGRESSIVENESS, "medium")
-        threshold = AGGRESSIVENESS_LEVELS.get(aggressiveness)
-        if threshold is None:
+        Called once at construction — an options update reloads the entry and
+        rebuilds the coordinator, so the derived values cannot go stale.
+        """
+        config = self.config
+        self._fuse_size = float(config.get(CONF_FUSE_SIZE, DEFAULT_FUSE_SIZE))
+        aggressiveness = config.get(CONF_AGGRESSIVENESS, "medium")
+        if aggressiveness not in AGGRESSIVENESS_LEVELS:
             _LOGGER.warning(
-                "Unknown aggressiveness value '%s' — falling back to 'medium'", aggressiveness
+                "Unknown aggressiveness value '%s' — falling back to 'medium'",
+                aggressiveness,
             )
-            threshold = AGGRESSIVENESS_LEVELS["medium"]
-        trigger_current = fuse_size * threshold
+            aggressiveness = "medium"
+        self._trigger_current = trigger_current(self._fuse_size, aggressiveness)
+        self._enabled_phases = tuple(
+            int(p) for p in config.get(CONF_ENABLED_PHASES, DEFAULT_ENABLED_PHASES)
+        )
+        self._spike_filter_seconds = config.get(
+            CONF_SPIKE_FILTER_TIME, DEFAULT_SPIKE_FILTER_TIME
+        )
+        # Cadence while an overload or restoration is in flight; idle ticks
+        # stretch to IDLE_UPDATE_INTERVAL (never shorter than the fast one).
+        self._fast_interval = timedelta(
+            seconds=config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        )
+        self._idle_interval = max(self._fast_interval, IDLE_UPDATE_INTERVAL)
+        # (entity_id, estimated Amperes) per toggleable device, in the user's
+        # configured order — that order is the drop priority. The per-device
+        # estimate is a single shared default until the config flow grows a
+        # per-device field.
+        self._device_draws: tuple[tuple[str, float], ...] = tuple(
+            (device, DEFAULT_DEVICE_DRAW)
+            for device in config.get(CONF_DEVICES_TO_TOGGLE, [])
+        )
+        self._device_index = {
+            device: i for i, (device, _) in enumerate(self._device_draws)
+        }
+        self._charging_entity = config.get(CONF_CHARGING_ENTITY)
+        self._restore_headroom = float(
+            config.get(CONF_RESTORE_HEADROOM, DEFAULT_RESTORE_HEADROOM)
+        )
+        self._notify_enabled = config.get(CONF_NOTIFY_ENABLED, DEFAULT_NOTIFY_ENABLED)
+        self._notify_target = config.get(CONF_NOTIFY_TARGET) or ""
+
+    @property
+    def disabled_devices(self) -> tuple[str, ...]:
+        """Currently disabled device entity_ids, in configured order."""
+        mask = self._disabled_mask
+        return tuple(
+            device
+            for i, (device, _) in enumerate(self._device_draws)
+            if mask & (1 << i)
+        )
+
+    def async_register_listeners(self) -> None:
+        """Subscribe to phase-sensor state changes for push-driven updates.
+
+        The sensors already push into HA's state machine, so reacting to their
+        events gives better latency than polling alone. The coordinator's
+        update_interval is kept as a safety-net re-sync — it also advances the
+        spike-filter and restore timers when the sensors go silent.
+        """
+        sensor_ids = [sensor_id for _, sensor_id in self._phase_sensor_map]
+        if sensor_ids:
+            self.entry.async_on_unload(
+                async_track_state_change_event(
+                    self.hass, sensor_ids, self._handle_phase_sensor_event
+                )
+            )
+
+        if charging_entity := self._charging_entity:
+            self.entry.async_on_unload(
+                async_track_state_change_event(
+                    self.hass, [charging_entity], self._handle_charger_event
+                )
+            )
+
+    async def _handle_phase_sensor_event(self, event: Event) -> None:
+        """Re-run the balancing pipeline when a phase sensor reports a change."""
+        # Debounced by the coordinator's request-refresh cooldown, so a burst
+        # of sensor updates collapses into a single pipeline run.
+        await self.async_request_refresh()
+
+    async def _handle_charger_event(self, event: Event) -> None:
+        """Drop the cached charger limits when the charger entity changes.
+
+        The min/max/step attributes only really change when the EVSE
+        integration reloads, but every state event carries fresh attributes,
+        so dropping the cache here keeps it trivially correct.
+        """
+        self._charger_limits = None
 
-        enabled_phases = [int(p) for p in self.config.get(CONF_ENABLED_PHASES, ["1", "2", "3"])]
+    def _get_charger_limits(self, state: Any) -> tuple[float, float, float]:
+        """Return the charger's (min, max, step) attributes, cached.
+
+        Parsed once per charger state change instead of on every reduce and
+        restore call.
+        """
+        limits = self._charger_limits
+        if limits is None:
+            attrs = state.attributes
+            try:
+                limits = (
+                    float(attrs.get("min", 5)),
+                    float(attrs.get("max", 32)),
+                    float(attrs.get("step", 1)),
+                )
+            except (ValueError, TypeError):
+                _LOGGER.warning(
+                    "Cannot parse min/max/step attributes for %s — using defaults 5/32/1",
+                    state.entity_id,
+                )
+                limits = (5.0, 32.0, 1.0)
+            self._charger_limits = limits
+        return limits
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from sensors and manage load."""
+        # ── Disabled-and-idle short circuit ───────────────────────────────────
+        # With the switch off and nothing left in a partially-reduced state,
+        # the whole pipeline would be dead work: no action may be taken and
+        # the payload cannot change. Return the previous payload untouched —
+        # always_update=False then skips the listener fan-out too. Flipping
+        # the switch back on makes the predicate false, so the next tick runs
+        # the full pipeline again.
+        if (
+            not self.enabled
+            and not self.is_managing_load
+            and not self._disabled_mask
+            and self.charging_original_value is None
+            and self.data is not None
+        ):
+            self.update_interval = self._idle_interval
+            return self.data
+
+        # One timestamp per tick — the whole cycle represents a single logical
+        # instant. A monotonic float makes every duration check a plain FP
+        # subtract and is immune to NTP slew / wall-clock jumps; only the
+        # user-visible last_triggered_time needs a real datetime.
+        now = time.monotonic()
+        phase_currents = await self._get_phase_currents()
+
+        # Derived once in _recompute_params — constants for this entry's lifetime
+        fuse_size = self._fuse_size
+        trigger = self._trigger_current
+        enabled_phases = self._enabled_phases
 
         # ── Sensor availability guard ─────────────────────────────────────────
         # If any enabled phase that has a sensor configured is returning None
         # (unavailable / unknown / bad value), skip all load management for this
         # cycle. Acting on incomplete data risks incorrect load reduction or
         # premature restoration. Also reset stale overload timers for those phases.
+        configured_phases = self._configured_phases
+        currents_get = phase_currents.get
         unavailable_phases = [
             phase
             for phase in enabled_phases
-            if self.config.get(_PHASE_SENSOR_KEY.get(phase, ""))
-            and phase_currents.get(phase) is None
+            if phase in configured_phases and currents_get(phase) is None
         ]
         if unavailable_phases:
             for phase in unavailable_phases:
-                if self.overload_start.get(phase) is not None:
+                if self._overload_start_ts[phase - 1] is not None:
                     _LOGGER.info(
                         "Phase %d sensor became unavailable — resetting overload timer", phase
                     )
-                    self.overload_start[phase] = None
+                    self._overload_start_ts[phase - 1] = None
             _LOGGER.warning(
                 "Phase %s sensor(s) unavailable or invalid — "
                 "skipping load management this cycle",
                 unavailable_phases,
             )
-            return {
-                "phase_currents": phase_currents,
-                "overloaded_phases": [],
-                "sustained_overloads": [],
-                "is_managing": self.is_managing_load,
-                "fuse_size": fuse_size,
-                "trigger_current": trigger_current,
-                "charging_original_value": self.charging_original_value,
-                "disabled_devices": list(self.disabled_devices),
-                "restore_headroom_since": self.restore_headroom_since,
-                "last_restore_step_time": self.last_restore_step_time,
-                "last_overloaded_phases": self.last_triggered_phases,
-                "last_peak_current": self.last_triggered_peak,
-                "trigger_current_at_event": self.last_triggered_threshold,
-            }
-
-        # ── Phase overload detection ──────────────────────────────────────────
-        overloaded_phases = []
+            return self._build_payload(phase_currents, [], [], fuse_size, trigger)
+
+        # ── Phase overload detection + spike filter (single pass) ─────────────
+        # Classify each phase, maintain its overload timer, and apply the spike
+        # filter in the same iteration — only sustained overloads trigger
+        # action. Phase membership is tracked in two 3-bit masks (bit = phase-1)
+        # and materialized into lists once, for the decision tree and payload.
+        overloaded_mask = 0
+        sustained_mask = 0
+        spike_filter_seconds = self._spike_filter_seconds
+        overload_start_ts = self._overload_start_ts
+        # Evaluated once per tick: skips building debug arg tuples in the loop
+        # when the logger runs at INFO (the common case).
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         for phase in enabled_phases:
-            if phase in phase_currents:
-                current = phase_currents[phase]
-                if current is not None and current > trigger_current:
-                    overloaded_phases.append(phase)
-                    if self.overload_start[phase] is None:
-                        self.overload_start[phase] = dt_util.utcnow()
-                        _LOGGER.info(
-                            "Phase %d overload started: %.1fA > %.1fA",
-                            phase, current, trigger_current,
-                        )
+            if phase not in phase_currents:
+                continue
+            current = phase_currents[phase]
+            idx = phase - 1
+            if current is not None and current > trigger:
+                overloaded_mask |= 1 << idx
+                started = overload_start_ts[idx]
+                if started is None:
+                    overload_start_ts[idx] = now
+                    _LOGGER.info(
+                        "Phase %d overload started: %.1fA > %.1fA",
+                        phase, current, trigger,
+                    )
                 else:
-                    if self.overload_start[phase] is not None:
-                        _LOGGER.info(
-                            "Phase %d overload cleared: %.1fA <= %.1fA",
-                            phase, current, trigger_current,
+                    duration = now - started
+                    if debug_enabled:
+                        _LOGGER.debug(
+                            "Phase %d overload duration: %.1fs / %ss",
+                            phase, duration, spike_filter_seconds,
                         )
-                    self.overload_start[phase] = None
-
-        # Apply spike filter — only act on sustained overloads
-        sustained_overloads = []
-        spike_filter_seconds = self.config.get(CONF_SPIKE_FILTER_TIME, 30)
-        for phase in overloaded_phases:
-            if self.overload_start[phase] is not None:
-                duration = (dt_util.utcnow() - self.overload_start[phase]).total_seconds()
-                _LOGGER.debug(
-                    "Phase %d overload duration: %.1fs / %ss",
-                    phase, duration, spike_filter_seconds,
-                )
-                if duration >= spike_filter_seconds:
-                    sustained_overloads.append(phase)
-                    _LOGGER.warning(
-                        "Phase %d sustained overload after %.1fs", phase, duration
+                    if duration >= spike_filter_seconds:
+                        sustained_mask |= 1 << idx
+                        _LOGGER.warning(
+                            "Phase %d sustained overload after %.1fs", phase, duration
+                        )
+            else:
+                if overload_start_ts[idx] is not None:
+                    _LOGGER.info(
+                        "Phase %d overload cleared: %.1fA <= %.1fA",
+                        phase, current, trigger,
                     )
+                overload_start_ts[idx] = None
+
+        overloaded_phases = [p for p in (1, 2, 3) if overloaded_mask & (1 << (p - 1))]
+        sustained_overloads = [p for p in (1, 2, 3) if sustained_mask & (1 << (p - 1))]
 
         # ── Load management decision ──────────────────────────────────────────
         is_enabled = self.enabled
+        self._next_restore_wait = None  # set by _maybe_restore_load while waiting
 
         if sustained_overloads and is_enabled:
             # Detect the moment an overload event begins (transition into managing state)
             new_event = not self.is_managing_load
             if new_event:
                 peak_current = max(
-                    (phase_currents[p] for p in sustained_overloads if phase_currents.get(p) is not None),
+                    (c for p in sustained_overloads if (c := currents_get(p)) is not None),
                     default=0.0,
                 )
                 self.last_triggered_time = dt_util.utcnow()
-                self.last_triggered_phases = list(sustained_overloads)
+                # Tuple, not list: the payload carries this by reference, and
+                # an immutable value keeps the always_update=False equality
+                # check honest across ticks.
+                self.last_triggered_phases = tuple(sustained_overloads)
                 self.last_triggered_peak = peak_current
-                self.last_triggered_threshold = trigger_current
+                self.last_triggered_threshold = trigger
                 await self._send_overload_notification(
-                    sustained_overloads, phase_currents, trigger_current, peak_current
+                    sustained_overloads, phase_currents, trigger, peak_current, now
                 )
 
             # Active overload: reduce load and reset restoration tracking
-            await self._reduce_load(sustained_overloads, phase_currents, trigger_current)
+            await self._reduce_load(sustained_overloads, phase_currents, trigger, now)
             self.is_managing_load = True
             self.restore_headroom_since = None
 
         elif is_enabled and (
             self.is_managing_load
-            or self.disabled_devices
+            or self._disabled_mask
             or self.charging_original_value is not None
         ):
             if overloaded_phases:
                 # Even a transient spike blocks restoration — reset the settle timer
-                _LOGGER.debug(
-                    "Transient overload on phase(s) %s — pausing restoration",
-                    overloaded_phases,
-                )
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Transient overload on phase(s) %s — pausing restoration",
+                        overloaded_phases,
+                    )
                 self.restore_headroom_since = None
             else:
                 # No overload at all: check whether headroom is sufficient to restore
-                await self._maybe_restore_load(phase_currents, trigger_current, enabled_phases)
+                await self._maybe_restore_load(phase_currents, trigger, enabled_phases, now)
+
+        # ── Adaptive polling cadence ──────────────────────────────────────────
+        # Fast ticks only matter while something is in flight — an overload
+        # timer counting toward the spike filter, active management, a
+        # restoration wait — or while any phase is running close enough to
+        # the trigger that the next appliance could tip it over. Otherwise the
+        # push listeners cover detection and the idle cadence merely keeps the
+        # safety-net poll alive. Worst-case first-detection latency in idle
+        # mode is one idle interval, which the spike filter (default 30 s)
+        # already tolerates.
+        near_trigger = NEAR_TRIGGER_RATIO * trigger
+        needs_fast = (
+            self.is_managing_load
+            or self.restore_headroom_since is not None
+            or any(started is not None for started in overload_start_ts)
+            or any(
+                c is not None and c > near_trigger for c in phase_currents.values()
+            )
+        )
+        if (wait := self._next_restore_wait) is not None:
+            # Mid-restoration wait: nothing can change before the settle/step
+            # deadline, so sleep up to the remainder (capped at the idle
+            # cadence) instead of ticking through the whole window. A fresh
+            # overload still wakes the pipeline early via the push-driven
+            # sensor listeners.
+            self.update_interval = timedelta(
+                seconds=min(
+                    max(wait, self._fast_interval.total_seconds()),
+                    IDLE_UPDATE_INTERVAL.total_seconds(),
+                )
+            )
+        elif needs_fast:
+            self.update_interval = self._fast_interval
+        else:
+            self.update_interval = self._idle_interval
 
+        return self._build_payload(
+            phase_currents, overloaded_phases, sustained_overloads, fuse_size, trigger
+        )
+
+    def _build_payload(
+        self,
+        phase_currents: dict[int, float | None],
+        overloaded_phases: list[int],
+        sustained_overloads: list[int],
+        fuse_size: float,
+        trigger: float,
+    ) -> dict[str, Any]:
+        """Build the coordinator data payload consumed by the entities.
+
+        A fresh dict each tick is deliberate: always_update=False compares the
+        new payload against the previous one, and mutating a shared dict in
+        place would make that comparison vacuously true and suppress all
+        entity updates.
+        """
         return {
             "phase_currents": phase_currents,
             "overloaded_phases": overloaded_phases,
             "sustained_overloads": sustained_overloads,
             "is_managing": self.is_managing_load,
             "fuse_size": fuse_size,
-            "trigger_current": trigger_current,
+            "trigger_current": trigger,
             "charging_original_value": self.charging_original_value,
-            "disabled_devices": list(self.disabled_devices),
+            "disabled_devices": self.disabled_devices,
             "restore_headroom_since": self.restore_headroom_since,
             "last_restore_step_time": self.last_restore_step_time,
             # Last overload event — consumed by the sensor
@@ -239,25 +506,28 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
     async def _get_phase_currents(self) -> dict[int, float | None]:
         """Get current readings from all phase sensors."""
         currents: dict[int, float | None] = {}
-        for phase_num, conf_key in [
-            (1, CONF_PHASE_1_SENSOR),
-            (2, CONF_PHASE_2_SENSOR),
-            (3, CONF_PHASE_3_SENSOR),
-        ]:
-            sensor_id = self.config.get(conf_key)
-            if sensor_id:
-                state = self.hass.states.get(sensor_id)
-                if state and state.state not in ("unknown", "unavailable"):
-                    try:
-                        currents[phase_num] = float(state.state)
-                    except (ValueError, TypeError):
-                        _LOGGER.warning(
-                            "Invalid current value for phase %d: %s",
-                            phase_num, state.state,
-                        )
-                        currents[phase_num] = None
-                else:
-                    currents[phase_num] = None
+        states_get = self.hass.states.get
+        parsed_cache = self._parsed_cache
+        for phase_num, sensor_id in self._phase_sensor_map:
+            state = states_get(sensor_id)
+            prev = parsed_cache.get(sensor_id)
+            if prev is not None and prev[0] is state:
+                # Same State instance as last tick — reading is unchanged
+                currents[phase_num] = prev[1]
+                continue
+            value = _parse_float(state)
+            if value is not None:
+                # Round to 0.1 A so sub-jitter sensor noise doesn't
+                # defeat the coordinator's equality-based update skip.
+                value = round(value, 1)
+            elif state is not None and state.state not in _BAD_STATES:
+                _LOGGER.warning(
+                    "Invalid current value for phase %d: %s",
+                    phase_num, state.state,
+                )
+            currents[phase_num] = value
+            if state is not None:
+                parsed_cache[sensor_id] = (state, value)
         return currents
 
     # ── Headroom helper ───────────────────────────────────────────────────────
@@ -266,19 +536,24 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         self,
         phase_currents: dict[int, float | None],
         trigger_current: float,
-        enabled_phases: list[int],
+        enabled_phases: tuple[int, ...],
     ) -> float:
         """Return the smallest headroom (trigger − current) across all enabled phases.
 
         A positive value means all phases are below the trigger. The smaller the
         number, the less room there is before the next overload.
         """
-        min_headroom = float("inf")
-        for phase in enabled_phases:
-            current = phase_currents.get(phase)
-            if current is not None:
-                min_headroom = min(min_headroom, trigger_current - current)
-        return min_headroom if min_headroom != float("inf") else 0.0
+        # The minimum of (trigger − current) is simply trigger minus the
+        # highest current — no per-phase subtraction or infinity sentinel.
+        max_current = max(
+            (
+                current
+                for phase in enabled_phases
+                if (current := phase_currents.get(phase)) is not None
+            ),
+            default=None,
+        )
+        return trigger_current - max_current if max_current is not None else 0.0
 
     # ── Notifications ─────────────────────────────────────────────────────────
 
@@ -288,16 +563,33 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         phase_currents: dict[int, float | None],
         trigger_current: float,
         peak_current: float,
+        now: float,
     ) -> None:
         """Send an overload notification via persistent_notification and optionally a mobile device.
 
         Both notification channels are skipped when notify_enabled is False.
+        A repeat of the same event (same phases, same threshold) within
+        NOTIFY_MIN_INTERVAL_SECS is coalesced so an oscillating load — e.g. a
+        washing-machine cycle bouncing in and out of overload — doesn't spam
+        the user's phone.
         """
-        if not self.config.get(CONF_NOTIFY_ENABLED, DEFAULT_NOTIFY_ENABLED):
+        if not self._notify_enabled:
             _LOGGER.debug("Notifications disabled — skipping overload alert")
             return
 
-        fuse_size = float(self.config.get(CONF_FUSE_SIZE, DEFAULT_FUSE_SIZE))
+        notify_key = (tuple(sorted(overloaded_phases)), round(trigger_current, 1))
+        if (
+            notify_key == self._last_notify_key
+            and self._last_notify_time is not None
+            and now - self._last_notify_time < NOTIFY_MIN_INTERVAL_SECS
+        ):
+            _LOGGER.debug(
+                "Suppressing duplicate overload notification for phase(s) %s",
+                overloaded_phases,
+            )
+            return
+
+        fuse_size = self._fuse_size
 
         # Build a readable phase summary, e.g. "L1: 24.3 A, L2: 23.1 A"
         phase_parts = []
@@ -316,8 +608,8 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         )
 
         # 1. Always create a persistent HA notification (visible as a bell icon in HA)
-        try:
-            await self.hass.services.async_call(
+        channels = [
+            self.hass.services.async_call(
                 "persistent_notification",
                 "create",
                 {
@@ -327,45 +619,66 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
                 },
                 blocking=False,
             )
-        except Exception as exc:
-            _LOGGER.error("Failed to create persistent notification: %s", exc)
+        ]
 
         # 2. Optionally send to a configured mobile device (stored as device_id)
-        device_id = self.config.get(CONF_NOTIFY_TARGET) or ""
+        mobile_service = None
+        device_id = self._notify_target
         if device_id:
             service = await self._resolve_mobile_notify_service(device_id)
             if service:
                 if not self.hass.services.has_service("notify", service):
+                    # Cached name may be stale (app re-paired) — drop it so the
+                    # next overload re-resolves from scratch.
+                    self._notify_service_cache.pop(device_id, None)
                     _LOGGER.warning(
                         "Notify service 'notify.%s' not registered — "
                         "open the HA companion app on the device once to activate it",
                         service,
                     )
                 else:
-                    try:
-                        await self.hass.services.async_call(
+                    mobile_service = service
+                    channels.append(
+                        self.hass.services.async_call(
                             "notify",
                             service,
                             {"title": title, "message": message},
                             blocking=False,
                         )
-                        _LOGGER.info("Overload notification sent to notify.%s", service)
-                    except Exception as exc:
-                        _LOGGER.error(
-                            "Failed to send notification to notify.%s: %s", service, exc
-                        )
+                    )
             else:
                 _LOGGER.warning(
                     "Could not resolve notify service for device_id '%s'", device_id
                 )
 
+        # The channels are independent I/O — dispatch them together
+        results = await asyncio.gather(*channels, return_exceptions=True)
+        if isinstance(results[0], Exception):
+            _LOGGER.error("Failed to create persistent notification: %s", results[0])
+        if mobile_service:
+            if isinstance(results[1], Exception):
+                _LOGGER.error(
+                    "Failed to send notification to notify.%s: %s",
+                    mobile_service, results[1],
+                )
+            else:
+                _LOGGER.info("Overload notification sent to notify.%s", mobile_service)
+
+        self._last_notify_key = notify_key
+        self._last_notify_time = now
+
     async def _resolve_mobile_notify_service(self, device_id: str) -> str | None:
         """Map a mobile_app device_id to its notify service name.
 
         First tries the mobile_app push registration data (most accurate).
-        Falls back to slugifying the device registry name.
+        Falls back to slugifying the device registry name. Results are cached
+        per device_id — the mapping only changes when the companion app is
+        re-paired, and the caller invalidates the cache if the cached service
+        turns out to be unregistered.
         """
-        from homeassistant.util import slugify  # local import — always available
+        cached = self._notify_service_cache.get(device_id)
+        if cached:
+            return cached
 
         # Primary: look up via mobile_app push registrations
         try:
@@ -378,16 +691,19 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
                 if reg.get("device_id") == device_id:
                     name = reg.get("device_name", "")
                     if name:
-                        return f"mobile_app_{slugify(name)}"
+                        service = f"mobile_app_{slugify(name)}"
+                        self._notify_service_cache[device_id] = service
+                        return service
         except Exception:
             pass
 
         # Fallback: slugify the HA device registry entry name
         try:
-            from homeassistant.helpers import device_registry as dr
             device = dr.async_get(self.hass).async_get(device_id)
             if device and device.name:
-                return f"mobile_app_{slugify(device.name)}"
+                service = f"mobile_app_{slugify(device.name)}"
+                self._notify_service_cache[device_id] = service
+                return service
         except Exception:
             pass
 
@@ -400,11 +716,12 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         overloaded_phases: list[int],
         phase_currents: dict[int, float | None],
         trigger_current: float,
+        now: float,
     ) -> None:
         """Reduce electrical load by adjusting charging current and toggling devices."""
         # Rate-limit: minimum 10 s between reduction actions
         if self.last_action_time:
-            elapsed = (dt_util.utcnow() - self.last_action_time).total_seconds()
+            elapsed = now - self.last_action_time
             if elapsed < 10:
                 return
 
@@ -421,7 +738,7 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         )
 
         # Step 1: Reduce EV charging current first (fine-grained control)
-        charging_entity = self.config.get(CONF_CHARGING_ENTITY)
+        charging_entity = self._charging_entity
         if charging_entity and total_overload > 0:
             reduction = await self._reduce_charging_current(charging_entity, total_overload)
             total_overload -= reduction
@@ -429,33 +746,71 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
 
         # Step 2: Toggle off devices if still overloaded
         if total_overload > 0:
-            devices = self.config.get(CONF_DEVICES_TO_TOGGLE, [])
+            device_draws = self._device_draws
             _LOGGER.info(
                 "Still overloaded by %.1fA — checking %d device(s)",
-                total_overload, len(devices),
+                total_overload, len(device_draws),
             )
-            for device in devices:
-                if device not in self.disabled_devices:
-                    state = self.hass.states.get(device)
-                    if state and state.state == "on":
-                        try:
-                            await self.hass.services.async_call(
+            # Walk the precomputed draw table until the estimated draws cover
+            # the remaining overload, then turn the selection off in one
+            # batched service call — sequential blocking round-trips through
+            # slow integrations (zigbee, cloud) would stall the coordinator.
+            states_get = self.hass.states.get
+            disabled_mask = self._disabled_mask
+            to_disable: list[str] = []
+            selected_mask = 0
+            remaining = total_overload
+            for i, (device, draw) in enumerate(device_draws):
+                if disabled_mask & (1 << i):
+                    continue
+                state = states_get(device)
+                if state and state.state == "on":
+                    to_disable.append(device)
+                    selected_mask |= 1 << i
+                    remaining -= draw
+                    if remaining <= 0:
+                        break
+                else:
+                    _LOGGER.debug("Device %s already off — skipping", device)
+
+            if to_disable:
+                # One service call with a list entity_id: HA fans it out
+                # internally, avoiding a registry round-trip per device.
+                try:
+                    await self.hass.services.async_call(
+                        "homeassistant",
+                        "turn_off",
+                        {"entity_id": to_disable},
+                        blocking=False,
+                    )
+                    self._disabled_mask |= selected_mask
+                    _LOGGER.info("Turned off device(s): %s", to_disable)
+                except Exception as exc:
+                    # Batch failed — retry per entity so one bad device
+                    # doesn't block the rest.
+                    _LOGGER.warning(
+                        "Batch turn_off failed (%s) — retrying per device", exc
+                    )
+                    results = await asyncio.gather(
+                        *(
+                            self.hass.services.async_call(
                                 "homeassistant",
                                 "turn_off",
                                 {"entity_id": device},
-                                blocking=True,
+                                blocking=False,
                             )
-                            self.disabled_devices.add(device)
+                            for device in to_disable
+                        ),
+                        return_exceptions=True,
+                    )
+                    for device, result in zip(to_disable, results):
+                        if isinstance(result, Exception):
+                            _LOGGER.error("Failed to turn off %s: %s", device, result)
+                        else:
+                            self._disabled_mask |= 1 << self._device_index[device]
                             _LOGGER.info("Turned off device: %s", device)
-                            total_overload -= 5  # rough estimate per device
-                            if total_overload <= 0:
-                                break
-                        except Exception as e:
-                            _LOGGER.error("Failed to turn off %s: %s", device, e)
-                    else:
-                        _LOGGER.debug("Device %s already off — skipping", device)
 
-        self.last_action_time = dt_util.utcnow()
+        self.last_action_time = now
 
     async def _reduce_charging_current(self, entity_id: str, overload_amps: float) -> float:
         """Reduce charging current by the overload amount plus a 2 A safety margin.
@@ -468,25 +823,15 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         if not state:
             _LOGGER.error("Charging entity %s not found", entity_id)
             return 0.0
-        if state.state in ("unknown", "unavailable"):
+        if state.state in _BAD_STATES:
             _LOGGER.warning("Charging entity %s is %s", entity_id, state.state)
             return 0.0
-        try:
-            current_value = float(state.state)
-        except (ValueError, TypeError) as exc:
-            _LOGGER.error("Cannot parse charging value '%s': %s", state.state, exc)
+        current_value = _parse_float(state)
+        if current_value is None:
+            _LOGGER.error("Cannot parse charging value '%s'", state.state)
             return 0.0
 
-        try:
-            min_value = float(state.attributes.get("min", 5))
-            max_value = float(state.attributes.get("max", 32))
-            step = float(state.attributes.get("step", 1))
-        except (ValueError, TypeError):
-            _LOGGER.warning(
-                "Cannot parse min/max/step attributes for %s — using defaults 5/32/1",
-                entity_id,
-            )
-            min_value, max_value, step = 5.0, 32.0, 1.0
+        min_value, max_value, step = self._get_charger_limits(state)
 
         if max_value <= min_value:
             _LOGGER.error(
@@ -495,10 +840,11 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
             )
             return 0.0
 
-        _LOGGER.debug(
-            "Charger %s: current=%.1fA  min=%.1f  max=%.1f  step=%.1f",
-            entity_id, current_value, min_value, max_value, step,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Charger %s: current=%.1fA  min=%.1f  max=%.1f  step=%.1f",
+                entity_id, current_value, min_value, max_value, step,
+            )
 
         # Store original value on first reduction so we know where to return to
         if self.charging_original_value is None:
@@ -512,8 +858,11 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         target_reduction = min(overload_amps + 2.0, current_value - min_value)
         new_value = current_value - target_reduction
 
-        # Snap to step grid
-        if step > 0:
+        # Snap to step grid. step == 1 (the common EVSE case) needs no
+        # divide/multiply dance — a plain round lands on the grid.
+        if step == 1:
+            new_value = round(new_value)
+        elif step > 0:
             new_value = round(new_value / step) * step
         new_value = max(min_value, min(max_value, new_value))
 
@@ -543,7 +892,8 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         self,
         phase_currents: dict[int, float | None],
         trigger_current: float,
-        enabled_phases: list[int],
+        enabled_phases: tuple[int, ...],
+        now: float,
     ) -> None:
         """Cautiously restore reduced load when there is sufficient stable headroom.
 
@@ -556,9 +906,7 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         increment OR one device re-enabled) and the cycle restarts so the system can
         observe the effect before the next step.
         """
-        restore_headroom = float(
-            self.config.get(CONF_RESTORE_HEADROOM, DEFAULT_RESTORE_HEADROOM)
-        )
+        restore_headroom = self._restore_headroom
 
         min_headroom = self._calculate_min_headroom(
             phase_currents, trigger_current, enabled_phases
@@ -576,39 +924,45 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
 
         # ── Gate 2: Has headroom been stable long enough? ─────────────────────
         if self.restore_headroom_since is None:
-            self.restore_headroom_since = dt_util.utcnow()
+            self.restore_headroom_since = now
+            self._next_restore_wait = float(RESTORE_SETTLE_SECS)
             _LOGGER.info(
                 "Headroom %.1fA detected (need %.1fA) — waiting %ds before restoring",
                 min_headroom, restore_headroom, RESTORE_SETTLE_SECS,
             )
             return
 
-        settle_elapsed = (dt_util.utcnow() - self.restore_headroom_since).total_seconds()
+        settle_elapsed = now - self.restore_headroom_since
         if settle_elapsed < RESTORE_SETTLE_SECS:
-            _LOGGER.debug(
-                "Settle timer: %.0fs / %ds (headroom %.1fA)",
-                settle_elapsed, RESTORE_SETTLE_SECS, min_headroom,
-            )
+            self._next_restore_wait = RESTORE_SETTLE_SECS - settle_elapsed
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Settle timer: %.0fs / %ds (headroom %.1fA)",
+                    settle_elapsed, RESTORE_SETTLE_SECS, min_headroom,
+                )
             return
 
         # ── Gate 3: Has enough time passed since the last restore step? ───────
         if self.last_restore_step_time is not None:
-            step_elapsed = (dt_util.utcnow() - self.last_restore_step_time).total_seconds()
+            step_elapsed = now - self.last_restore_step_time
             if step_elapsed < RESTORE_STEP_SECS:
-                _LOGGER.debug(
-                    "Waiting %.0fs more before next restore step (headroom %.1fA)",
-                    RESTORE_STEP_SECS - step_elapsed, min_headroom,
-                )
+                self._next_restore_wait = RESTORE_STEP_SECS - step_elapsed
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Waiting %.0fs more before next restore step (headroom %.1fA)",
+                        RESTORE_STEP_SECS - step_elapsed, min_headroom,
+                    )
                 return
 
         # ── All gates passed: take one restoration step ───────────────────────
-        await self._restore_one_step(phase_currents, trigger_current, min_headroom)
+        await self._restore_one_step(phase_currents, trigger_current, min_headroom, now)
 
     async def _restore_one_step(
         self,
         phase_currents: dict[int, float | None],
         trigger_current: float,
         available_headroom: float,
+        now: float,
     ) -> None:
         """Perform a single restoration step and update the step timer.
 
@@ -616,15 +970,13 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         A step is only taken if the headroom comfortably exceeds the amount that
         step would add back to the load.
         """
-        restore_headroom = float(
-            self.config.get(CONF_RESTORE_HEADROOM, DEFAULT_RESTORE_HEADROOM)
-        )
+        restore_headroom = self._restore_headroom
 
         # ── 1. Try to increase charger by one step ────────────────────────────
-        charging_entity = self.config.get(CONF_CHARGING_ENTITY)
+        charging_entity = self._charging_entity
         if charging_entity and self.charging_original_value is not None:
             state = self.hass.states.get(charging_entity)
-            if not state or state.state in ("unknown", "unavailable"):
+            if not state or state.state in _BAD_STATES:
                 # Charger is offline (car disconnected, EVSE unreachable, etc.).
                 # It is no longer drawing current, so holding charging_original_value
                 # set forever would keep is_managing_load = True and suppress all
@@ -636,13 +988,13 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
                     charging_entity,
                 )
                 self.charging_original_value = None
+            elif (current_value := _parse_float(state)) is None:
+                _LOGGER.error(
+                    "Error reading charger state during restore: %s", state.state
+                )
             else:
                 try:
-                    current_value = float(state.state)
-                    try:
-                        step = float(state.attributes.get("step", 1))
-                    except (ValueError, TypeError):
-                        step = 1.0
+                    step = self._get_charger_limits(state)[2]
 
                     # Need headroom > step + safety margin to safely add one step
                     needed = step + restore_headroom
@@ -659,7 +1011,7 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
                                 "Restore: charging %.1fA → %.1fA (headroom was %.1fA)",
                                 current_value, target, available_headroom,
                             )
-                            self.last_restore_step_time = dt_util.utcnow()
+                            self.last_restore_step_time = now
 
                             if target >= self.charging_original_value:
                                 self.charging_original_value = None
@@ -685,24 +1037,24 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
                     _LOGGER.error("Error reading charger state during restore: %s", exc)
 
         # ── 2. Try to re-enable one disabled device ───────────────────────────
-        if self.disabled_devices:
+        if self._disabled_mask:
             # We don't know exactly how much each device draws, so require at
             # least restore_headroom as a conservative guard.
             if available_headroom >= restore_headroom:
-                device = next(iter(self.disabled_devices))
+                device = self.disabled_devices[0]
                 try:
                     await self.hass.services.async_call(
                         "homeassistant",
                         "turn_on",
                         {"entity_id": device},
-                        blocking=True,
+                        blocking=False,
                     )
-                    self.disabled_devices.discard(device)
+                    self._disabled_mask &= ~(1 << self._device_index[device])
                     _LOGGER.info(
                         "Restore: re-enabled device %s (headroom was %.1fA)",
                         device, available_headroom,
                     )
-                    self.last_restore_step_time = dt_util.utcnow()
+                    self.last_restore_step_time = now
                     return
                 except Exception as exc:
                     _LOGGER.error("Failed to restore device %s: %s", device, exc)
@@ -728,39 +1080,91 @@ class LoadBalancerCoordinator(DataUpdateCoordinator):
         """
         _LOGGER.info("Load balancing disabled — forcing immediate restore")
 
-        charging_entity = self.config.get(CONF_CHARGING_ENTITY)
+        # The charger write and the device batch are independent — run them
+        # concurrently so the switch turn-off isn't serialized behind two
+        # blocking round-trips.
+        tasks = []
+        charging_entity = self._charging_entity
+        restore_charging = False
         if charging_entity and self.charging_original_value is not None:
             state = self.hass.states.get(charging_entity)
-            if state and state.state not in ("unknown", "unavailable"):
-                try:
-                    await self.hass.services.async_call(
+            if state and state.state not in _BAD_STATES:
+                restore_charging = True
+                tasks.append(
+                    self.hass.services.async_call(
                         "number",
                         "set_value",
                         {"entity_id": charging_entity, "value": self.charging_original_value},
                         blocking=True,
                     )
-                    _LOGGER.info(
-                        "Charging restored to %.1fA", self.charging_original_value
-                    )
-                except Exception as exc:
-                    _LOGGER.error("Failed to restore charging current: %s", exc)
+                )
 
-        for device in list(self.disabled_devices):
-            try:
-                await self.hass.services.async_call(
+        # One batched turn_on — HA fans the list out internally
+        devices = list(self.disabled_devices)
+        if devices:
+            tasks.append(
+                self.hass.services.async_call(
                     "homeassistant",
                     "turn_on",
-                    {"entity_id": device},
-                    blocking=True,
+                    {"entity_id": devices},
+                    blocking=False,
                 )
-                _LOGGER.info("Restored device: %s", device)
-            except Exception as exc:
-                _LOGGER.error("Failed to restore device %s: %s", device, exc)
+            )
+
+        if tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if restore_charging:
+                if isinstance(results[0], Exception):
+                    _LOGGER.error("Failed to restore charging current: %s", results[0])
+                else:
+                    _LOGGER.info(
+                        "Charging restored to %.1fA", self.charging_original_value
+                    )
+            if devices:
+                if isinstance(results[-1], Exception):
+                    # Batch failed — retry per device so a single bad entity
+                    # doesn't leave the rest off.
+                    _LOGGER.warning(
+                        "Batch turn_on failed (%s) — retrying per device", results[-1]
+                    )
+                    retry = await asyncio.gather(
+                        *(
+                            self.hass.services.async_call(
+                                "homeassistant",
+                                "turn_on",
+                                {"entity_id": device},
+                                blocking=False,
+                            )
+                            for device in devices
+                        ),
+                        return_exceptions=True,
+                    )
+                    for device, result in zip(devices, retry):
+                        if isinstance(result, Exception):
+                            _LOGGER.error("Failed to restore device %s: %s", device, result)
+                        else:
+                            _LOGGER.info("Restored device: %s", device)
+                else:
+                    _LOGGER.info("Restored device(s): %s", devices)
 
         # Clear all state
         self.charging_original_value = None
-        self.disabled_devices.clear()
+        self._disabled_mask = 0
         self.is_managing_load = False
         self.restore_headroom_since = None
         self.last_restore_step_time = None
         self.last_action_time = None
+
+        # Publish a payload reflecting the restored-idle state. While the
+        # switch stays off the disabled-and-idle short circuit keeps serving
+        # the retained payload, so without this the entities would keep
+        # showing the pre-disable managing/restoring attributes indefinitely.
+        self.async_set_updated_data(
+            self._build_payload(
+                (self.data or {}).get("phase_currents", {}),
+                [],
+                [],
+                self._fuse_size,
+                self._trigger_current,
+            )
+        )
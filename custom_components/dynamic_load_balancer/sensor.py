@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
@@ -37,6 +38,7 @@ class LastTriggeredSensor(CoordinatorEntity, SensorEntity):
 
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_icon = "mdi:clock-alert-outline"
+    _attr_name = "Load Balancer Last Overload"
 
     def __init__(
         self,
@@ -45,10 +47,18 @@ class LastTriggeredSensor(CoordinatorEntity, SensorEntity):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_name = "Load Balancer Last Overload"
-        self._attr_unique_id = f"{entry.entry_id}_last_triggered"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
+        self._entry_id = entry.entry_id
+
+    @cached_property
+    def unique_id(self) -> str:
+        """Return a unique ID, computed once per instance."""
+        return f"{self._entry_id}_last_triggered"
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device info, computed once per instance."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry_id)},
             name="Dynamic Load Balancer",
             manufacturer="Custom Integration",
             model="Electrical Load Balancer",
@@ -64,7 +74,7 @@ class LastTriggeredSensor(CoordinatorEntity, SensorEntity):
         """Return extra detail about the last overload event."""
         data = self.coordinator.data or {}
         return {
-            "last_overloaded_phases": data.get("last_overloaded_phases", []),
+            "last_overloaded_phases": data.get("last_overloaded_phases", ()),
             "last_peak_current": data.get("last_peak_current"),
             "trigger_current_at_event": data.get("trigger_current_at_event"),
         }
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -31,6 +32,11 @@ async def async_setup_entry(
 class LoadBalancerSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
     """Switch to enable/disable load balancing."""
 
+    # Static for every instance — class attributes avoid per-instance dict
+    # entries and are read directly by the Entity base class.
+    _attr_name = "Dynamic Load Balancer"
+    _attr_icon = "mdi:transmission-tower"
+
     def __init__(
         self,
         coordinator: LoadBalancerCoordinator,
@@ -38,12 +44,23 @@ class LoadBalancerSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
-        self._attr_name = "Dynamic Load Balancer"
-        self._attr_unique_id = f"{entry.entry_id}_load_balancer_switch"
-        self._attr_icon = "mdi:transmission-tower"
+        self._entry_id = entry.entry_id
         self._enabled = True
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
+        # Rendered once per coordinator update (see
+        # _handle_coordinator_update) — the base class serves the stored
+        # dict on every state write without a property call.
+        self._attr_extra_state_attributes = self._build_attrs()
+
+    @cached_property
+    def unique_id(self) -> str:
+        """Return a unique ID, computed once per instance."""
+        return f"{self._entry_id}_load_balancer_switch"
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device info, computed once per instance."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry_id)},
             name="Dynamic Load Balancer",
             manufacturer="Custom Integration",
             model="Electrical Load Balancer",
@@ -65,9 +82,17 @@ class LoadBalancerSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
         """Return true if the switch is on."""
         return self._enabled
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the rendered attributes when the coordinator publishes."""
+        self._attr_extra_state_attributes = self._build_attrs()
+        super()._handle_coordinator_update()
+
+    def _build_attrs(self) -> dict[str, Any]:
+        """Render the extra state attributes from the coordinator payload.
+
+        Called once per coordinator update, not per HA state read.
+        """
         data = self.coordinator.data or {}
 
         phase_currents = data.get("phase_currents", {})
@@ -113,6 +138,9 @@ class LoadBalancerSwitch(CoordinatorEntity, SwitchEntity, RestoreEntity):
         self._enabled = True
         self.coordinator.enabled = True
         self.async_write_ha_state()
+        # Kick a full cycle immediately — the coordinator idles with stale
+        # data while disabled and would otherwise wait out the slow poll.
+        await self.coordinator.async_request_refresh()
         _LOGGER.info("Load balancing enabled")
 
     async def async_turn_off(self, **kwargs: Any) -> None: